@@ -87,6 +87,11 @@ class AutogradBox(qml.math.TensorBox):
 
     @property
     def requires_grad(self):
+        if hasattr(self.data, "_value"):
+            # Catches the edge case where the data is an Autograd arraybox,
+            # which only occurs during backpropagation.
+            return True
+
         return self.data.requires_grad
 
     @wrap_output
@@ -44,20 +44,28 @@ def _state_preparation_pauli_words(num_wires):
         num_wires (int): Number of wires of the state preparation
 
     Returns:
-        List[str]: List of all necessary Pauli words for the state preparation
+        Tuple[str]: All necessary Pauli words for the state preparation. The result is cached
+        per number of wires, and hence returned as an immutable tuple.
     """
-    if num_wires == 1:
-        return ["X", "Y"]
-
-    sub_pauli_words = _state_preparation_pauli_words(num_wires - 1)
-    sub_id = "I" * (num_wires - 1)
-
-    single_qubit_words = ["X" + sub_id, "Y" + sub_id]
-    multi_qubit_words = list(map(lambda word: "I" + word, sub_pauli_words)) + list(
-        map(lambda word: "X" + word, sub_pauli_words)
-    )
-
-    return single_qubit_words + multi_qubit_words
+    # Each pair of words consists of a prefix of "I"s and "X"s, followed by "X" or "Y" and
+    # padded with identities. The prefixes are enumerated in depth-first order, with
+    # shorter prefixes first and "I" before "X".
+    pauli_words = []
+    prefix = ""
+
+    while True:
+        padding = "I" * (num_wires - 1 - len(prefix))
+        pauli_words += [prefix + "X" + padding, prefix + "Y" + padding]
+
+        if len(prefix) < num_wires - 1:
+            prefix += "I"
+            continue
+
+        # backtrack to the last "I" and replace it with an "X"
+        prefix = prefix.rstrip("X")
+        if not prefix:
+            return tuple(pauli_words)
+        prefix = prefix[:-1] + "X"
 
 
 @template
@@ -14,6 +14,7 @@
 r"""
 Contains the ``BasisStatePreparation`` template.
 """
+import numpy as np
 
 import pennylane as qml
 from pennylane.templates.decorator import template
@@ -42,12 +43,12 @@ def _preprocess(basis_state, wires):
     if n_bits != len(wires):
         raise ValueError(f"Basis state must be of length {len(wires)}; got length {n_bits}.")
 
-    basis_state = list(qml.math.toarray(basis_state))
+    basis_state = qml.math.toarray(basis_state)
 
-    if not all(bit in [0, 1] for bit in basis_state):
-        raise ValueError(f"Basis state must only consist of 0s and 1s; got {basis_state}")
+    if not np.all((basis_state == 0) | (basis_state == 1)):
+        raise ValueError(f"Basis state must only consist of 0s and 1s; got {list(basis_state)}")
 
-    # we return the input as a list of values, since
+    # we return the input as a NumPy array, since
     # it is not differentiable
     return basis_state
 
@@ -77,6 +78,5 @@ def BasisStatePreparation(basis_state, wires):
 
     basis_state = _preprocess(basis_state, wires)
 
-    for wire, state in zip(wires, basis_state):
-        if state == 1:
-            qml.PauliX(wire)
+    for idx in np.flatnonzero(basis_state):
+        qml.PauliX(wires[idx])
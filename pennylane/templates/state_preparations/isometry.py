@@ -0,0 +1,201 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+r"""
+Contains the isometry-based state preparation used by ``MottonenStatePreparation``.
+"""
+import numpy as np
+
+import pennylane as qml
+
+# Hadamard gate, used to turn the CZ gates of the decomposition into CNOT gates
+_H = np.array([[1, 1], [1, -1]]) / np.sqrt(2)
+
+# diagonal of exp(i pi/4 Z)
+_T = np.array([np.exp(1j * np.pi / 4), np.exp(-1j * np.pi / 4)])
+
+
+def _demultiplex(a, b):
+    r"""Demultiplexes a single-qubit gate that is controlled by one qubit.
+
+    Finds unitaries :math:`u, v` and a diagonal :math:`r` such that
+
+    .. math:: a = r^* u D v, \quad b = r u D^\dagger v,
+
+    where :math:`D = \exp(i \frac{\pi}{4} Z)`. See Eq. (3) in
+    `Bergholm et al. (2005) <https://arxiv.org/abs/quant-ph/0410066>`_.
+
+    Args:
+        a (array): gate applied if the control is in state :math:`|0\rangle`
+        b (array): gate applied if the control is in state :math:`|1\rangle`
+
+    Returns:
+        array, array, array: the unitaries :math:`v` and :math:`u`, and the diagonal of :math:`r`
+    """
+    x = a @ b.conj().T
+
+    # choose the phases r such that r x r has eigenvalues i and -i
+    rho1 = (np.pi - 2 * np.angle(x[0, 0])) / 4
+    rho2 = -np.angle(np.linalg.det(x)) / 2 - rho1
+    r = np.exp(1j * np.array([rho1, rho2]))
+
+    eigvals, u = np.linalg.eig(r[:, np.newaxis] * x * r)
+
+    if eigvals[0].imag < 0:
+        u = u[:, ::-1]
+
+    v = _T[:, np.newaxis] * u.conj().T @ (r.conj()[:, np.newaxis] * b)
+
+    return v, u, r
+
+
+def _decompose_ucg(gates):
+    r"""Decomposes a uniformly-controlled gate into single-qubit gates and CNOT gates, up to a
+    diagonal gate.
+
+    A uniformly-controlled gate with :math:`k` controls applies the gate ``gates[i]`` to the target
+    if the controls are in the computational basis state :math:`|i\rangle`, where the first
+    control is the least significant bit of :math:`i`. It is implemented by :math:`2^k`
+    single-qubit gates on the target, interleaved with :math:`2^k-1` CNOT gates. The :math:`j`-th
+    CNOT gate is controlled by the control with index equal to the number of trailing zeros of
+    :math:`j`. The uniformly-controlled gate is equal to this circuit followed by a diagonal gate.
+
+    For more details, see `Bergholm et al. (2005) <https://arxiv.org/abs/quant-ph/0410066>`_.
+
+    Args:
+        gates (list[array]): the :math:`2^k` single-qubit gates
+
+    Returns:
+        list[array], array: the single-qubit gates of the circuit in temporal order, and the
+        diagonal of the remaining diagonal gate, where the target is the least significant qubit
+    """
+    gates = [np.array(gate, dtype=complex) for gate in gates]
+    num_gates = len(gates)
+    diagonal = np.ones(2 * num_gates, dtype=complex)
+
+    if num_gates == 1:
+        return gates, diagonal
+
+    # Demultiplex the most significant remaining control of each uniformly-controlled gate, which
+    # splits it into two gates with one control less that are separated by a CZ gate. The
+    # diagonal gates left over from each step are diagonal in all remaining controls, and hence
+    # commute with the CZ gates and are merged into the next gate in temporal order.
+    length = num_gates
+    while length > 1:
+        half = length // 2
+
+        for shift in range(0, num_gates, length):
+            for i in range(half):
+                v, u, r = _demultiplex(gates[shift + i], gates[shift + half + i])
+                gates[shift + i] = v
+                gates[shift + half + i] = u * _T
+
+                # left over diagonal, depending on the state of the demultiplexed control
+                d0 = r.conj() * _T[0]
+                d1 = r * _T[1]
+
+                if shift + length < num_gates:
+                    gates[shift + length + i] *= d0
+                    gates[shift + length + half + i] *= d1
+                else:
+                    diagonal = diagonal.reshape(-1, length, 2)
+                    diagonal[:, i] *= d0
+                    diagonal[:, half + i] *= d1
+                    diagonal = diagonal.reshape(-1)
+
+        length = half
+
+    # turn the CZ gates into CNOT gates by conjugating the target with Hadamard gates
+    gates[0] = _H @ gates[0]
+    for i in range(1, num_gates - 1):
+        gates[i] = _H @ gates[i] @ _H
+    gates[-1] = gates[-1] @ _H
+
+    return gates, diagonal
+
+
+def _rot_angles(gate):
+    r"""Computes the angles of a :class:`~.Rot` gate that is equal to a single-qubit gate up to
+    a global phase.
+
+    Args:
+        gate (array): single-qubit unitary
+
+    Returns:
+        tuple[float]: the angles :math:`\phi, \theta, \omega`
+    """
+    gate = gate / np.sqrt(np.linalg.det(gate))
+
+    theta = 2 * np.arctan2(np.abs(gate[1, 0]), np.abs(gate[0, 0]))
+    phi = -np.angle(gate[0, 0]) - np.angle(gate[1, 0])
+    omega = -np.angle(gate[0, 0]) + np.angle(gate[1, 0])
+
+    return phi, theta, omega
+
+
+def isometry_state_preparation(state_vector, wires):
+    r"""Prepares a state using the isometry decomposition of
+    `Iten et al. (2016) <https://arxiv.org/abs/1501.06911>`_.
+
+    The inverse of the state preparation disentangles one qubit after the other, starting with
+    the last wire. For the :math:`m`-th wire, this is done by a uniformly-controlled gate that is
+    controlled by all previous wires and decomposed into :math:`2^{m-1}-1` CNOT gates, up to a
+    diagonal gate that is absorbed into the remaining state. Overall, this uses
+    :math:`2^n-n-1` CNOT gates on :math:`n` wires.
+
+    .. note::
+
+        The final state is only equal to the input state vector up to a global phase.
+
+    Args:
+        state_vector (array): normalized state vector of shape ``(2^n,)``
+        wires (Wires): the :math:`n` wires to prepare the state on
+    """
+    state = np.array(state_vector, dtype=complex)
+    ops = []
+
+    for m in range(len(wires), 0, -1):
+        # rows index the state of the control wires, columns the state of the target wire
+        pairs = state.reshape(-1, 2)
+        norms = np.linalg.norm(pairs, axis=1)
+
+        gates = []
+        for (x0, x1), norm in zip(pairs, norms):
+            if norm == 0.0:
+                gates.append(np.eye(2))
+            else:
+                gates.append(np.array([[x0.conjugate(), x1.conjugate()], [-x1, x0]]) / norm)
+
+        gates, diagonal = _decompose_ucg(gates)
+
+        # the uniformly-controlled gate maps the target to |0>, and only the diagonal gate
+        # itself is not applied
+        state = norms * diagonal[::2].conj()
+
+        # the first control is the least significant bit of the control state
+        target = wires[m - 1]
+        controls = wires[: m - 1][::-1]
+
+        for i, gate in enumerate(gates):
+            ops.append((gate, target))
+
+            if i < len(gates) - 1:
+                control_index = ((i + 1) & -(i + 1)).bit_length() - 1
+                ops.append((None, [controls[control_index], target]))
+
+    # apply the inverse of the disentangling circuit
+    for gate, op_wires in reversed(ops):
+        if gate is None:
+            qml.CNOT(wires=op_wires)
+        elif not np.allclose(gate, gate[0, 0] * np.eye(2)):
+            qml.Rot(*_rot_angles(gate.conj().T), wires=op_wires)
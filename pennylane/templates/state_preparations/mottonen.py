@@ -14,27 +14,30 @@
 r"""
 Contains the ``MottonenStatePreparation`` template.
 """
+import functools
+
 import numpy as np
+from autograd.numpy.numpy_boxes import ArrayBox
 
 import pennylane as qml
 
 from pennylane.templates.decorator import template
+from pennylane.templates.state_preparations.isometry import isometry_state_preparation
 from pennylane.wires import Wires
 
 
-def _preprocess(state_vector, wires):
-    """Validate and pre-process inputs as follows:
+def _check_state_vector(state_vector, wires):
+    """Validate the state vector as follows:
 
     * Check the shape of the state vector.
     * Check that the state vector is normalized.
-    * Extract polar coordinates of the state vector.
 
     Args:
         state_vector (tensor_like): amplitude state vector to prepare
         wires (Wires): wires that template acts on
 
     Returns:
-        tensor_like, tensor_like, Wires: amplitudes a, phases omega and preprocessed wires
+        tensor_like: amplitudes a of the state vector
     """
     shape = qml.math.shape(state_vector)
 
@@ -47,10 +50,29 @@ def _preprocess(state_vector, wires):
             f"State vector must be of length {2 ** len(wires)} or less; got length {n_amplitudes}."
         )
 
-    norm = qml.math.sum(qml.math.abs(state_vector) ** 2)
+    a = qml.math.abs(state_vector)
+    norm = qml.math.sum(a ** 2)
     if not qml.math.allclose(norm, 1.0, atol=1e-3):
         raise ValueError("State vector has to be of length 1.0, got {}".format(norm))
-    a = qml.math.abs(state_vector)
+
+    return a
+
+
+def _preprocess(state_vector, wires):
+    """Validate and pre-process inputs as follows:
+
+    * Check the shape of the state vector.
+    * Check that the state vector is normalized.
+    * Extract polar coordinates of the state vector.
+
+    Args:
+        state_vector (tensor_like): amplitude state vector to prepare
+        wires (Wires): wires that template acts on
+
+    Returns:
+        tensor_like, tensor_like, Wires: amplitudes a, phases omega and preprocessed wires
+    """
+    a = _check_state_vector(state_vector, wires)
     omega = qml.math.angle(state_vector)
 
     # change ordering of wires, since original code was written for IBM machines
@@ -60,30 +82,31 @@ def _preprocess(state_vector, wires):
 
 
 # pylint: disable=len-as-condition,arguments-out-of-order,consider-using-enumerate
-def gray_code(rank):
-    """Generates the Gray code of given rank.
+def gray_code_iter(rank):
+    r"""Iterates over the Gray code of given rank, yielding each code word as an integer.
+
+    The :math:`i`-th code word is given by the closed form :math:`g(i) = i \oplus (i \gg 1)`.
 
     Args:
         rank (int): rank of the Gray code (i.e. number of bits)
-    """
 
-    def gray_code_recurse(g, rank):
-        k = len(g)
-        if rank <= 0:
-            return
+    Yields:
+        int: the next code word
+    """
+    for i in range(1 << rank):
+        yield i ^ (i >> 1)
 
-        for i in range(k - 1, -1, -1):
-            char = "1" + g[i]
-            g.append(char)
-        for i in range(k - 1, -1, -1):
-            g[i] = "0" + g[i]
 
-        gray_code_recurse(g, rank - 1)
+def gray_code(rank):
+    """Generates the Gray code of given rank.
 
-    g = ["0", "1"]
-    gray_code_recurse(g, rank - 1)
+    Args:
+        rank (int): rank of the Gray code (i.e. number of bits)
 
-    return g
+    Returns:
+        list[str]: code words as bitstrings
+    """
+    return [format(g, f"0{rank}b") for g in gray_code_iter(rank)]
 
 
 def _matrix_M_entry(row, col):
@@ -110,6 +133,41 @@ def _matrix_M_entry(row, col):
     return (-1) ** sum_of_ones
 
 
+@functools.lru_cache()
+def _matrix_M_trans(ln):
+    """Returns the transpose of the matrix that maps alpha to theta.
+
+    The matrix only depends on its dimension, so it is cached and shared between all
+    uniformly-controlled rotations of the same size.
+
+    Args:
+        ln (int): number of rows and columns
+
+    Returns:
+        tuple[tuple[int]]: rows of the transposed transformation matrix
+    """
+    # the matrix is shared between all callers, so it is cached in an immutable form
+    return tuple(tuple(_matrix_M_entry(j, i) for j in range(ln)) for i in range(ln))
+
+
+@functools.lru_cache()
+def _control_indices(rank):
+    """Returns the indices of the control wires of the CNOT gates in the Gray code
+    implementation of a uniformly-controlled rotation.
+
+    Args:
+        rank (int): number of control wires
+
+    Returns:
+        tuple[int]: control index of each CNOT gate
+    """
+    code = list(gray_code_iter(rank))
+
+    # the control of each CNOT is the bit flipped between consecutive code words,
+    # where the last code word wraps around to the first
+    return tuple((g ^ g_next).bit_length() - 1 for g, g_next in zip(code, code[1:] + code[:1]))
+
+
 def _compute_theta(alpha):
     """Maps the angles alpha of the multi-controlled rotations decomposition of a uniformly controlled rotation
      to the rotation angles used in the Gray code implementation.
@@ -123,11 +181,9 @@ def _compute_theta(alpha):
     ln = alpha.shape[0]
     k = np.log2(alpha.shape[0])
 
-    M_trans = np.zeros(shape=(ln, ln))
-    for i in range(len(M_trans)):
-        for j in range(len(M_trans[0])):
-            M_trans[i, j] = _matrix_M_entry(j, i)
-
+    # a new array is created for every call, since interfaces such as Torch
+    # may share its memory
+    M_trans = np.array(_matrix_M_trans(ln), dtype=float)
     theta = qml.math.dot(M_trans, alpha)
 
     return theta / 2 ** k
@@ -164,15 +220,7 @@ def _uniform_rotation_dagger(gate, alpha, control_wires, target_wire):
             gate(theta[0], wires=[target_wire])
         return
 
-    code = gray_code(gray_code_rank)
-    num_selections = len(code)
-
-    control_indices = [
-        int(np.log2(int(code[i], 2) ^ int(code[(i + 1) % num_selections], 2)))
-        for i in range(num_selections)
-    ]
-
-    for i, control_index in enumerate(control_indices):
+    for i, control_index in enumerate(_control_indices(gray_code_rank)):
         if theta[i] != 0.0:
             gate(theta[i], wires=[target_wire])
         qml.CNOT(wires=[control_wires[control_index], target_wire])
@@ -194,18 +242,10 @@ def _get_alpha_z(omega, n, k):
     Returns:
         array representing :math:`\alpha^{z,k}`
     """
-    indices1 = [
-        [(2 * j - 1) * 2 ** (k - 1) + l - 1 for l in range(1, 2 ** (k - 1) + 1)]
-        for j in range(1, 2 ** (n - k) + 1)
-    ]
-    indices2 = [
-        [(2 * j - 2) * 2 ** (k - 1) + l - 1 for l in range(1, 2 ** (k - 1) + 1)]
-        for j in range(1, 2 ** (n - k) + 1)
-    ]
-
-    term1 = qml.math.take(omega, indices=indices1)
-    term2 = qml.math.take(omega, indices=indices2)
-    diff = (term1 - term2) / 2 ** (k - 1)
+    # group the phases into blocks of 2^k consecutive entries, and split each block
+    # into the halves where the k-th qubit is in state 0 and 1, respectively
+    omega = qml.math.reshape(omega, (2 ** (n - k), 2, 2 ** (k - 1)))
+    diff = (omega[:, 1, :] - omega[:, 0, :]) / 2 ** (k - 1)
 
     return qml.math.sum(diff, axis=1)
 
@@ -226,16 +266,11 @@ def _get_alpha_y(a, n, k):
     Returns:
         array representing :math:`\alpha^{y,k}`
     """
-    indices_numerator = [
-        [(2 * (j + 1) - 1) * 2 ** (k - 1) + l for l in range(2 ** (k - 1))]
-        for j in range(2 ** (n - k))
-    ]
-    numerator = qml.math.take(a, indices=indices_numerator)
-    numerator = qml.math.sum(qml.math.abs(numerator) ** 2, axis=1)
-
-    indices_denominator = [[j * 2 ** k + l for l in range(2 ** k)] for j in range(2 ** (n - k))]
-    denominator = qml.math.take(a, indices=indices_denominator)
-    denominator = qml.math.sum(qml.math.abs(denominator) ** 2, axis=1)
+    # group the squared amplitudes into blocks of 2^k consecutive entries, and split
+    # each block into the halves where the k-th qubit is in state 0 and 1, respectively
+    squared = qml.math.reshape(a ** 2, (2 ** (n - k), 2, 2 ** (k - 1)))
+    numerator = qml.math.sum(squared[:, 1, :], axis=1)
+    denominator = qml.math.sum(squared[:, 0, :], axis=1) + numerator
 
     # Divide only where denominator is zero, else leave initial value of zero.
     # The equation guarantees that the numerator is also zero in the corresponding entries.
@@ -248,8 +283,32 @@ def _get_alpha_y(a, n, k):
     return 2 * qml.math.arcsin(qml.math.sqrt(division))
 
 
+def _is_differentiated(state_vector):
+    """Checks whether a gradient is being computed with respect to the state vector.
+
+    Arrays that are not traced by their interface, such as JAX arrays and PennyLane NumPy
+    arrays outside of backpropagation, are treated as constants.
+
+    Args:
+        state_vector (tensor_like): state vector
+
+    Returns:
+        bool: whether the state vector is being differentiated
+    """
+    interface = qml.math.get_interface(state_vector)
+
+    if interface == "autograd":
+        # Autograd only wraps the state vector in an arraybox during backpropagation
+        return isinstance(state_vector, ArrayBox)
+
+    if interface in ("torch", "tf"):
+        return qml.math.requires_grad(state_vector)
+
+    return False
+
+
 @template
-def MottonenStatePreparation(state_vector, wires):
+def MottonenStatePreparation(state_vector, wires, method="mottonen"):
     r"""
     Prepares an arbitrary state on the given wires using a decomposition into gates developed
     by `Möttönen et al. (2004) <https://arxiv.org/pdf/quant-ph/0407010.pdf>`_.
@@ -264,6 +323,19 @@ def MottonenStatePreparation(state_vector, wires):
 
     This code is adapted from code written by Carsten Blank for PennyLane-Qiskit.
 
+    By specifying the keyword argument ``method``, an alternative decomposition can be used:
+
+    * ``method='mottonen'`` (default): uses the decomposition of Möttönen et al. described above,
+      with up to :math:`2^{N+1}-4` CNOT gates on :math:`N` wires.
+
+    * ``method='isometry'``: uses the isometry decomposition of
+      `Iten et al. (2016) <https://arxiv.org/abs/1501.06911>`_, which replaces each pair of
+      uniformly controlled rotations by a single uniformly controlled gate that is implemented up
+      to a diagonal gate. This needs only :math:`2^N-N-1` CNOT gates, but the gate parameters are
+      computed with NumPy and are therefore not differentiable with respect to ``state_vector``.
+      A ``ValueError`` is raised if a gradient is computed with respect to ``state_vector``;
+      otherwise it is treated as a constant.
+
     .. note::
 
         The final state is only equal to the input state vector up to a global phase.
@@ -274,6 +346,7 @@ def MottonenStatePreparation(state_vector, wires):
             or equal to the total number of wires.
         wires (Iterable or Wires): Wires that the template acts on. Accepts an iterable of numbers or strings, or
             a Wires object.
+        method (str): the decomposition to use, either ``'mottonen'`` or ``'isometry'``
 
     Raises:
         ValueError: if inputs do not have the correct format
@@ -282,8 +355,22 @@ def MottonenStatePreparation(state_vector, wires):
     ###############
     # Input checks
 
+    if method not in ("mottonen", "isometry"):
+        raise ValueError(f"did not recognize method {method}")
+
     wires = Wires(wires)
 
+    if method == "isometry":
+        if _is_differentiated(state_vector):
+            raise ValueError(
+                "The isometry method does not support differentiating with respect to the "
+                "state vector; use method='mottonen' instead."
+            )
+
+        _check_state_vector(state_vector, wires)
+        isometry_state_preparation(qml.math.toarray(state_vector), wires)
+        return
+
     a, omega, wires_reverse = _preprocess(state_vector, wires)
 
     # Apply inverse y rotation cascade to prepare correct absolute values of amplitudes
@@ -299,5 +386,7 @@ def MottonenStatePreparation(state_vector, wires):
             alpha_z_k = _get_alpha_z(omega, len(wires_reverse), k)
             control = wires_reverse[k:]
             target = wires_reverse[k - 1]
-            if len(alpha_z_k) > 0:
+            # a uniformly-controlled rotation with vanishing angles is the identity,
+            # so its CNOT ladder can be skipped as well
+            if not qml.math.allclose(alpha_z_k, 0):
                 _uniform_rotation_dagger(qml.RZ, alpha_z_k, control, target)
@@ -189,3 +189,16 @@ def test_requires_grad():
     x = np.array([[1, 2], [3, 4]], requires_grad=True)
     xT = qml.math.TensorBox(x)
     assert xT.requires_grad
+
+
+def test_requires_grad_arraybox():
+    """Test that the requires grad attribute is True for an Autograd arraybox,
+    which is the case during backpropagation"""
+    res = []
+
+    def cost_fn(x):
+        res.append(qml.math.TensorBox(x).requires_grad)
+        return np.sum(x)
+
+    qml.grad(cost_fn)(np.array([1.0, 2.0], requires_grad=True))
+    assert res == [True]
@@ -18,6 +18,7 @@ Integration tests should be placed into ``test_templates.py``.
 # pylint: disable=protected-access,cell-var-from-loop
 
 import math
+import warnings
 from unittest.mock import patch
 from pennylane import numpy as np
 import pytest
@@ -27,14 +28,105 @@ from pennylane.templates.state_preparations import (
     MottonenStatePreparation,
     ArbitraryStatePreparation,
 )
-from pennylane.templates.state_preparations.mottonen import gray_code
+from pennylane.templates.state_preparations.mottonen import gray_code, gray_code_iter
 from pennylane.templates.state_preparations.arbitrary_state_preparation import (
     _state_preparation_pauli_words,
 )
-from pennylane.templates.state_preparations.mottonen import _get_alpha_y
+from pennylane.templates.state_preparations.mottonen import _get_alpha_y, _get_alpha_z
 from pennylane.wires import Wires
 
 
+# fmt: off
+MOTTONEN_TEST_DATA = [
+    ([1, 0], [0], [1, 0, 0, 0, 0, 0, 0, 0]),
+    ([1, 0], [1], [1, 0, 0, 0, 0, 0, 0, 0]),
+    ([1, 0], [2], [1, 0, 0, 0, 0, 0, 0, 0]),
+    ([0, 1], [0], [0, 0, 0, 0, 1, 0, 0, 0]),
+    ([0, 1], [1], [0, 0, 1, 0, 0, 0, 0, 0]),
+    ([0, 1], [2], [0, 1, 0, 0, 0, 0, 0, 0]),
+    ([0, 1, 0, 0], [0, 1], [0, 0, 1, 0, 0, 0, 0, 0]),
+    ([0, 0, 0, 1], [0, 2], [0, 0, 0, 0, 0, 1, 0, 0]),
+    ([0, 0, 0, 1], [1, 2], [0, 0, 0, 1, 0, 0, 0, 0]),
+    ([1, 0, 0, 0, 0, 0, 0, 0], [0, 1, 2], [1, 0, 0, 0, 0, 0, 0, 0]),
+    ([0, 0, 0, 0, 1j, 0, 0, 0], [0, 1, 2], [0, 0, 0, 0, 1j, 0, 0, 0]),
+    ([1/2, 0, 0, 0, 1/2, 1j/2, -1/2, 0], [0, 1, 2], [1/2, 0, 0, 0, 1/2, 1j/2, -1/2, 0]),
+    ([1/3, 0, 0, 0, 2j/3, 2j/3, 0, 0], [0, 1, 2], [1/3, 0, 0, 0, 2j/3, 2j/3, 0, 0]),
+    ([2/3, 0, 0, 0, 1/3, 0, 0, 2/3], [0, 1, 2], [2/3, 0, 0, 0, 1/3, 0, 0, 2/3]),
+    (
+        [1/math.sqrt(8), 1j/math.sqrt(8), 1/math.sqrt(8), -1j/math.sqrt(8), 1/math.sqrt(8), 1/math.sqrt(8), 1/math.sqrt(8), 1j/math.sqrt(8)],
+        [0, 1, 2],
+        [1/math.sqrt(8), 1j/math.sqrt(8), 1/math.sqrt(8), -1j/math.sqrt(8), 1/math.sqrt(8), 1/math.sqrt(8), 1/math.sqrt(8), 1j/math.sqrt(8)],
+    ),
+    (
+        [-0.17133152-0.18777771j, 0.00240643-0.40704011j, 0.18684538-0.36315606j, -0.07096948+0.104501j, 0.30357755-0.23831927j, -0.38735106+0.36075556j, 0.12351096-0.0539908j, 0.27942828-0.24810483j],
+        [0, 1, 2],
+        [-0.17133152-0.18777771j, 0.00240643-0.40704011j, 0.18684538-0.36315606j, -0.07096948+0.104501j, 0.30357755-0.23831927j, -0.38735106+0.36075556j, 0.12351096-0.0539908j, 0.27942828-0.24810483j],
+    ),
+    (
+        [-0.29972867+0.04964242j, -0.28309418+0.09873227j, 0.00785743-0.37560696j, -0.3825148 +0.00674343j, -0.03008048+0.31119167j, 0.03666351-0.15935903j, -0.25358831+0.35461265j, -0.32198531+0.33479292j],
+        [0, 1, 2],
+        [-0.29972867+0.04964242j, -0.28309418+0.09873227j, 0.00785743-0.37560696j, -0.3825148 +0.00674343j, -0.03008048+0.31119167j, 0.03666351-0.15935903j, -0.25358831+0.35461265j, -0.32198531+0.33479292j],
+    ),
+    (
+        [-0.39340123+0.05705932j, 0.1980509 -0.24234781j, 0.27265585-0.0604432j, -0.42641249+0.25767258j, 0.40386614-0.39925987j, 0.03924761+0.13193724j, -0.06059103-0.01753834j, 0.21707136-0.15887973j],
+        [0, 1, 2],
+        [-0.39340123+0.05705932j, 0.1980509 -0.24234781j, 0.27265585-0.0604432j, -0.42641249+0.25767258j, 0.40386614-0.39925987j, 0.03924761+0.13193724j, -0.06059103-0.01753834j, 0.21707136-0.15887973j],
+    ),
+    (
+        [-1.33865287e-01+0.09802308j, 1.25060033e-01+0.16087698j, -4.14678130e-01-0.00774832j, 1.10121136e-01+0.37805482j, -3.21284864e-01+0.21521063j, -2.23121454e-04+0.28417422j, 5.64131205e-02+0.38135286j, 2.32694503e-01+0.41331133j],
+        [0, 1, 2],
+        [-1.33865287e-01+0.09802308j, 1.25060033e-01+0.16087698j, -4.14678130e-01-0.00774832j, 1.10121136e-01+0.37805482j, -3.21284864e-01+0.21521063j, -2.23121454e-04+0.28417422j, 5.64131205e-02+0.38135286j, 2.32694503e-01+0.41331133j],
+    ),
+    ([1/2, 0, 0, 0, 1j/2, 0, 1j/math.sqrt(2), 0], [0, 1, 2], [1/2, 0, 0, 0, 1j/2, 0, 1j/math.sqrt(2), 0]),
+    ([1/2, 0, 1j/2, 1j/math.sqrt(2)], [0, 1], [1/2, 0, 0, 0, 1j/2, 0, 1j/math.sqrt(2), 0]),
+]
+# fmt: on
+
+
+@pytest.fixture(scope="module")
+def device_name():
+    """Name of the device used by the integration tests in this module. This is
+    ``lightning.qubit`` if the plugin is installed, and ``default.qubit`` otherwise."""
+    try:
+        qml.device("lightning.qubit", wires=1)
+        return "lightning.qubit"
+    except qml.DeviceError:
+        return "default.qubit"
+
+
+@pytest.fixture
+def qubit_device_3_wires(device_name):
+    """Overrides the fixture of the same name in ``conftest.py``, so that the state
+    preparation tests in this module run on ``lightning.qubit`` when available."""
+    return qml.device(device_name, wires=3)
+
+
+@pytest.fixture(scope="module")
+def mottonen_states(device_name):
+    """Returns a function that prepares a state vector on a three-qubit device using
+    MottonenStatePreparation. Prepared states are cached, so that tests sharing the
+    same inputs only run the decomposition once."""
+    dev = qml.device(device_name, wires=3)
+    cache = {}
+
+    def prepare(state_vector, wires):
+        key = (tuple(state_vector), tuple(wires))
+
+        if key not in cache:
+
+            @qml.qnode(dev)
+            def circuit():
+                MottonenStatePreparation(state_vector, wires)
+                return qml.expval(qml.PauliZ(0))
+
+            circuit()
+            cache[key] = dev.state
+
+        return cache[key]
+
+    return prepare
+
+
 class TestHelperFunctions:
     """Tests the functionality of helper functions."""
 
@@ -51,6 +143,13 @@ class TestHelperFunctions:
 
         assert gray_code(rank) == expected_gray_code
 
+    @pytest.mark.parametrize("rank", [1, 2, 3, 5])
+    def test_gray_code_iter(self, rank):
+        """Tests that the function gray_code_iter yields the integer values of
+        the code words returned by gray_code."""
+
+        assert list(gray_code_iter(rank)) == [int(g, 2) for g in gray_code(rank)]
+
     @pytest.mark.parametrize(
         "num_wires,expected_pauli_words",
         [
@@ -79,8 +178,7 @@ class TestHelperFunctions:
     )
     def test_state_preparation_pauli_words(self, num_wires, expected_pauli_words):
         """Test that the correct Pauli words are returned."""
-        for idx, pauli_word in enumerate(_state_preparation_pauli_words(num_wires)):
-            assert expected_pauli_words[idx] == pauli_word
+        assert _state_preparation_pauli_words(num_wires) == tuple(expected_pauli_words)
 
 
 class TestBasisStatePreparation:
@@ -194,135 +292,35 @@ class TestBasisStatePreparation:
 class TestMottonenStatePreparation:
     """Tests the template MottonenStatePreparation."""
 
-    # fmt: off
-    @pytest.mark.parametrize("state_vector,wires,target_state", [
-        ([1, 0], [0], [1, 0, 0, 0, 0, 0, 0, 0]),
-        ([1, 0], [1], [1, 0, 0, 0, 0, 0, 0, 0]),
-        ([1, 0], [2], [1, 0, 0, 0, 0, 0, 0, 0]),
-        ([0, 1], [0], [0, 0, 0, 0, 1, 0, 0, 0]),
-        ([0, 1], [1], [0, 0, 1, 0, 0, 0, 0, 0]),
-        ([0, 1], [2], [0, 1, 0, 0, 0, 0, 0, 0]),
-        ([0, 1, 0, 0], [0, 1], [0, 0, 1, 0, 0, 0, 0, 0]),
-        ([0, 0, 0, 1], [0, 2], [0, 0, 0, 0, 0, 1, 0, 0]),
-        ([0, 0, 0, 1], [1, 2], [0, 0, 0, 1, 0, 0, 0, 0]),
-        ([1, 0, 0, 0, 0, 0, 0, 0], [0, 1, 2], [1, 0, 0, 0, 0, 0, 0, 0]),
-        ([0, 0, 0, 0, 1j, 0, 0, 0], [0, 1, 2], [0, 0, 0, 0, 1j, 0, 0, 0]),
-        ([1/2, 0, 0, 0, 1/2, 1j/2, -1/2, 0], [0, 1, 2], [1/2, 0, 0, 0, 1/2, 1j/2, -1/2, 0]),
-        ([1/3, 0, 0, 0, 2j/3, 2j/3, 0, 0], [0, 1, 2], [1/3, 0, 0, 0, 2j/3, 2j/3, 0, 0]),
-        ([2/3, 0, 0, 0, 1/3, 0, 0, 2/3], [0, 1, 2], [2/3, 0, 0, 0, 1/3, 0, 0, 2/3]),
-        (
-            [1/math.sqrt(8), 1j/math.sqrt(8), 1/math.sqrt(8), -1j/math.sqrt(8), 1/math.sqrt(8), 1/math.sqrt(8), 1/math.sqrt(8), 1j/math.sqrt(8)],
-            [0, 1, 2],
-            [1/math.sqrt(8), 1j/math.sqrt(8), 1/math.sqrt(8), -1j/math.sqrt(8), 1/math.sqrt(8), 1/math.sqrt(8), 1/math.sqrt(8), 1j/math.sqrt(8)],
-        ),
-        (
-            [-0.17133152-0.18777771j, 0.00240643-0.40704011j, 0.18684538-0.36315606j, -0.07096948+0.104501j, 0.30357755-0.23831927j, -0.38735106+0.36075556j, 0.12351096-0.0539908j, 0.27942828-0.24810483j],
-            [0, 1, 2],
-            [-0.17133152-0.18777771j, 0.00240643-0.40704011j, 0.18684538-0.36315606j, -0.07096948+0.104501j, 0.30357755-0.23831927j, -0.38735106+0.36075556j, 0.12351096-0.0539908j, 0.27942828-0.24810483j],
-        ),
-        (
-            [-0.29972867+0.04964242j, -0.28309418+0.09873227j, 0.00785743-0.37560696j, -0.3825148 +0.00674343j, -0.03008048+0.31119167j, 0.03666351-0.15935903j, -0.25358831+0.35461265j, -0.32198531+0.33479292j],
-            [0, 1, 2],
-            [-0.29972867+0.04964242j, -0.28309418+0.09873227j, 0.00785743-0.37560696j, -0.3825148 +0.00674343j, -0.03008048+0.31119167j, 0.03666351-0.15935903j, -0.25358831+0.35461265j, -0.32198531+0.33479292j],
-        ),
-        (
-            [-0.39340123+0.05705932j, 0.1980509 -0.24234781j, 0.27265585-0.0604432j, -0.42641249+0.25767258j, 0.40386614-0.39925987j, 0.03924761+0.13193724j, -0.06059103-0.01753834j, 0.21707136-0.15887973j],
-            [0, 1, 2],
-            [-0.39340123+0.05705932j, 0.1980509 -0.24234781j, 0.27265585-0.0604432j, -0.42641249+0.25767258j, 0.40386614-0.39925987j, 0.03924761+0.13193724j, -0.06059103-0.01753834j, 0.21707136-0.15887973j],
-        ),
-        (
-            [-1.33865287e-01+0.09802308j, 1.25060033e-01+0.16087698j, -4.14678130e-01-0.00774832j, 1.10121136e-01+0.37805482j, -3.21284864e-01+0.21521063j, -2.23121454e-04+0.28417422j, 5.64131205e-02+0.38135286j, 2.32694503e-01+0.41331133j],
-            [0, 1, 2],
-            [-1.33865287e-01+0.09802308j, 1.25060033e-01+0.16087698j, -4.14678130e-01-0.00774832j, 1.10121136e-01+0.37805482j, -3.21284864e-01+0.21521063j, -2.23121454e-04+0.28417422j, 5.64131205e-02+0.38135286j, 2.32694503e-01+0.41331133j],
-        ),
-        ([1/2, 0, 0, 0, 1j/2, 0, 1j/math.sqrt(2), 0], [0, 1, 2], [1/2, 0, 0, 0, 1j/2, 0, 1j/math.sqrt(2), 0]),
-        ([1/2, 0, 1j/2, 1j/math.sqrt(2)], [0, 1], [1/2, 0, 0, 0, 1j/2, 0, 1j/math.sqrt(2), 0]),
-    ])
-    # fmt: on
+    @pytest.mark.parametrize("state_vector,wires,target_state", MOTTONEN_TEST_DATA)
     def test_state_preparation_fidelity(
-        self, tol, qubit_device_3_wires, state_vector, wires, target_state
+        self, tol, mottonen_states, state_vector, wires, target_state
     ):
         """Tests that the template MottonenStatePreparation integrates correctly with PennyLane
         and produces states with correct fidelity."""
 
-        @qml.qnode(qubit_device_3_wires)
-        def circuit():
-            MottonenStatePreparation(state_vector, wires)
-
-            return qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliZ(1)), qml.expval(qml.PauliZ(2))
-
-        circuit()
+        target_state = np.asarray(target_state, dtype=np.complex128)
 
-        state = circuit.device.state.ravel()
+        state = mottonen_states(state_vector, wires)
         fidelity = abs(np.vdot(state, target_state)) ** 2
 
         # We test for fidelity here, because the vector themselves will hardly match
         # due to imperfect state preparation
         assert np.isclose(fidelity, 1, atol=tol, rtol=0)
 
-    # fmt: off
-    @pytest.mark.parametrize("state_vector,wires,target_state", [
-        ([1, 0], [0], [1, 0, 0, 0, 0, 0, 0, 0]),
-        ([1, 0], [1], [1, 0, 0, 0, 0, 0, 0, 0]),
-        ([1, 0], [2], [1, 0, 0, 0, 0, 0, 0, 0]),
-        ([0, 1], [0], [0, 0, 0, 0, 1, 0, 0, 0]),
-        ([0, 1], [1], [0, 0, 1, 0, 0, 0, 0, 0]),
-        ([0, 1], [2], [0, 1, 0, 0, 0, 0, 0, 0]),
-        ([0, 1, 0, 0], [0, 1], [0, 0, 1, 0, 0, 0, 0, 0]),
-        ([0, 0, 0, 1], [0, 2], [0, 0, 0, 0, 0, 1, 0, 0]),
-        ([0, 0, 0, 1], [1, 2], [0, 0, 0, 1, 0, 0, 0, 0]),
-        ([1, 0, 0, 0, 0, 0, 0, 0], [0, 1, 2], [1, 0, 0, 0, 0, 0, 0, 0]),
-        ([0, 0, 0, 0, 1j, 0, 0, 0], [0, 1, 2], [0, 0, 0, 0, 1j, 0, 0, 0]),
-        ([1/2, 0, 0, 0, 1/2, 1j/2, -1/2, 0], [0, 1, 2], [1/2, 0, 0, 0, 1/2, 1j/2, -1/2, 0]),
-        ([1/3, 0, 0, 0, 2j/3, 2j/3, 0, 0], [0, 1, 2], [1/3, 0, 0, 0, 2j/3, 2j/3, 0, 0]),
-        ([2/3, 0, 0, 0, 1/3, 0, 0, 2/3], [0, 1, 2], [2/3, 0, 0, 0, 1/3, 0, 0, 2/3]),
-        (
-            [1/math.sqrt(8), 1j/math.sqrt(8), 1/math.sqrt(8), -1j/math.sqrt(8), 1/math.sqrt(8), 1/math.sqrt(8), 1/math.sqrt(8), 1j/math.sqrt(8)],
-            [0, 1, 2],
-            [1/math.sqrt(8), 1j/math.sqrt(8), 1/math.sqrt(8), -1j/math.sqrt(8), 1/math.sqrt(8), 1/math.sqrt(8), 1/math.sqrt(8), 1j/math.sqrt(8)],
-        ),
-        (
-            [-0.17133152-0.18777771j, 0.00240643-0.40704011j, 0.18684538-0.36315606j, -0.07096948+0.104501j, 0.30357755-0.23831927j, -0.38735106+0.36075556j, 0.12351096-0.0539908j, 0.27942828-0.24810483j],
-            [0, 1, 2],
-            [-0.17133152-0.18777771j, 0.00240643-0.40704011j, 0.18684538-0.36315606j, -0.07096948+0.104501j, 0.30357755-0.23831927j, -0.38735106+0.36075556j, 0.12351096-0.0539908j, 0.27942828-0.24810483j],
-        ),
-        (
-            [-0.29972867+0.04964242j, -0.28309418+0.09873227j, 0.00785743-0.37560696j, -0.3825148 +0.00674343j, -0.03008048+0.31119167j, 0.03666351-0.15935903j, -0.25358831+0.35461265j, -0.32198531+0.33479292j],
-            [0, 1, 2],
-            [-0.29972867+0.04964242j, -0.28309418+0.09873227j, 0.00785743-0.37560696j, -0.3825148 +0.00674343j, -0.03008048+0.31119167j, 0.03666351-0.15935903j, -0.25358831+0.35461265j, -0.32198531+0.33479292j],
-        ),
-        (
-            [-0.39340123+0.05705932j, 0.1980509 -0.24234781j, 0.27265585-0.0604432j, -0.42641249+0.25767258j, 0.40386614-0.39925987j, 0.03924761+0.13193724j, -0.06059103-0.01753834j, 0.21707136-0.15887973j],
-            [0, 1, 2],
-            [-0.39340123+0.05705932j, 0.1980509 -0.24234781j, 0.27265585-0.0604432j, -0.42641249+0.25767258j, 0.40386614-0.39925987j, 0.03924761+0.13193724j, -0.06059103-0.01753834j, 0.21707136-0.15887973j],
-        ),
-        (
-            [-1.33865287e-01+0.09802308j, 1.25060033e-01+0.16087698j, -4.14678130e-01-0.00774832j, 1.10121136e-01+0.37805482j, -3.21284864e-01+0.21521063j, -2.23121454e-04+0.28417422j, 5.64131205e-02+0.38135286j, 2.32694503e-01+0.41331133j],
-            [0, 1, 2],
-            [-1.33865287e-01+0.09802308j, 1.25060033e-01+0.16087698j, -4.14678130e-01-0.00774832j, 1.10121136e-01+0.37805482j, -3.21284864e-01+0.21521063j, -2.23121454e-04+0.28417422j, 5.64131205e-02+0.38135286j, 2.32694503e-01+0.41331133j],
-        ),
-        ([1/2, 0, 0, 0, 1j/2, 0, 1j/math.sqrt(2), 0], [0, 1, 2], [1/2, 0, 0, 0, 1j/2, 0, 1j/math.sqrt(2), 0]),
-        ([1/2, 0, 1j/2, 1j/math.sqrt(2)], [0, 1], [1/2, 0, 0, 0, 1j/2, 0, 1j/math.sqrt(2), 0]),
-    ])
-    # fmt: on
+    @pytest.mark.parametrize("state_vector,wires,target_state", MOTTONEN_TEST_DATA)
     def test_state_preparation_probability_distribution(
-        self, tol, qubit_device_3_wires, state_vector, wires, target_state
+        self, tol, mottonen_states, state_vector, wires, target_state
     ):
         """Tests that the template MottonenStatePreparation integrates correctly with PennyLane
         and produces states with correct probability distribution."""
 
-        @qml.qnode(qubit_device_3_wires)
-        def circuit():
-            MottonenStatePreparation(state_vector, wires)
-
-            return qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliZ(1)), qml.expval(qml.PauliZ(2))
-
-        circuit()
+        state = mottonen_states(state_vector, wires)
 
-        state = circuit.device.state.ravel()
+        target_state = np.asarray(target_state, dtype=np.complex128)
 
-        probabilities = np.abs(state) ** 2
-        target_probabilities = np.abs(target_state) ** 2
+        probabilities = state.real ** 2 + state.imag ** 2
+        target_probabilities = target_state.real ** 2 + target_state.imag ** 2
 
         assert np.allclose(probabilities, target_probabilities, atol=tol, rtol=0)
 
@@ -368,6 +366,21 @@ class TestMottonenStatePreparation:
         res = _get_alpha_y(state, 3, current_qubit)
         assert np.allclose(res, expected, atol=tol)
 
+    @pytest.mark.parametrize(
+        "current_qubit, expected",
+        [
+            (1, np.array([np.pi / 2, -np.pi, np.pi / 2, 3 * np.pi / 4])),
+            (2, np.array([np.pi / 4, 7 * np.pi / 8])),
+            (3, np.array([-3 * np.pi / 16])),
+        ],
+    )
+    def test_get_alpha_z(self, current_qubit, expected, tol):
+        """Test the _get_alpha_z helper function."""
+
+        omega = np.array([0, np.pi / 2, np.pi, 0, -np.pi / 2, 0, np.pi / 4, np.pi])
+        res = _get_alpha_z(omega, 3, current_qubit)
+        assert np.allclose(res, expected, atol=tol)
+
     def test_exception_wrong_dim(self):
         """Verifies that exception is raised if the
         number of dimensions of features is incorrect."""
@@ -422,6 +435,36 @@ class TestMottonenStatePreparation:
 
         assert circuit.qtape.get_resources()["CNOT"] == n_CNOT
 
+    # fmt: off
+    @pytest.mark.parametrize("state_vector, n_wires", [
+        ([1/2, 1/2, -1/2, -1/2], 2),
+        ([1/2, 1/2, 1j/2, 1j/2], 2),
+        ([1/math.sqrt(8)] * 4 + [-1/math.sqrt(8)] * 4, 3),
+        ([1/math.sqrt(8)] * 4 + [1j/math.sqrt(8)] * 4, 3),
+    ])
+    # fmt: on
+    def test_trivial_RZ_rotations_skipped(self, state_vector, n_wires, tol):
+        """Tests whether the uniformly-controlled RZ rotations are skipped for qubits
+        whose relative phases vanish"""
+
+        n_CNOT = 2 ** n_wires - 2
+
+        dev = qml.device("default.qubit", wires=n_wires)
+
+        @qml.qnode(dev)
+        def circuit(state_vector):
+            MottonenStatePreparation(state_vector, wires=range(n_wires))
+            return qml.expval(qml.PauliX(wires=0))
+
+        # the phases only depend on the first qubit, so the RZ cascade
+        # reduces to a single rotation without CNOT gates
+        circuit(state_vector)
+
+        assert circuit.qtape.get_resources()["CNOT"] == n_CNOT
+
+        fidelity = abs(np.vdot(dev.state, state_vector)) ** 2
+        assert np.isclose(fidelity, 1, atol=tol, rtol=0)
+
     @pytest.mark.parametrize(
         "state_vector", [np.array([0.70710678, 0.70710678]), np.array([0.70710678, 0.70710678j])]
     )
@@ -437,6 +480,130 @@ class TestMottonenStatePreparation:
 
         qml.grad(circuit)(state_vector)
 
+    @pytest.mark.parametrize("state_vector,wires,target_state", MOTTONEN_TEST_DATA)
+    def test_isometry_method(self, tol, qubit_device_3_wires, state_vector, wires, target_state):
+        """Tests that the isometry method of MottonenStatePreparation produces states with
+        correct fidelity, using at most 2^n - n - 1 CNOT gates."""
+        target_state = np.asarray(target_state, dtype=np.complex128)
+
+        @qml.qnode(qubit_device_3_wires)
+        def circuit():
+            MottonenStatePreparation(state_vector, wires, method="isometry")
+            return qml.expval(qml.PauliZ(0))
+
+        circuit()
+
+        state = circuit.device.state
+        fidelity = abs(np.vdot(state, target_state)) ** 2
+
+        assert np.isclose(fidelity, 1, atol=tol, rtol=0)
+
+        n_wires = len(wires)
+        assert circuit.qtape.get_resources().get("CNOT", 0) <= 2 ** n_wires - n_wires - 1
+
+    @pytest.mark.parametrize("n_wires", [4, 5])
+    def test_isometry_method_random_states(self, tol, n_wires):
+        """Tests that the isometry method of MottonenStatePreparation prepares random states
+        on more wires, using fewer CNOT gates than the default method."""
+        rng = np.random.default_rng(42)
+        state_vector = rng.normal(size=2 ** n_wires) + 1j * rng.normal(size=2 ** n_wires)
+        state_vector = state_vector / np.linalg.norm(state_vector)
+
+        dev = qml.device("default.qubit", wires=n_wires)
+
+        @qml.qnode(dev)
+        def circuit(method):
+            MottonenStatePreparation(state_vector, wires=range(n_wires), method=method)
+            return qml.expval(qml.PauliZ(0))
+
+        circuit("mottonen")
+        n_CNOT_mottonen = circuit.qtape.get_resources()["CNOT"]
+
+        circuit("isometry")
+        n_CNOT_isometry = circuit.qtape.get_resources()["CNOT"]
+
+        fidelity = abs(np.vdot(dev.state, state_vector)) ** 2
+        assert np.isclose(fidelity, 1, atol=tol, rtol=0)
+
+        assert n_CNOT_isometry == 2 ** n_wires - n_wires - 1
+        assert n_CNOT_isometry < n_CNOT_mottonen // 2
+
+    def test_error_unknown_method(self):
+        """Tests that an error is raised if the decomposition method is not recognized."""
+
+        with pytest.raises(ValueError, match="did not recognize method"):
+            MottonenStatePreparation([1, 0], wires=[0], method="unknown")
+
+    def test_error_isometry_trainable_state(self):
+        """Tests that an error is raised if the isometry method is used with a trainable
+        state vector, since its gate parameters are not differentiable."""
+        dev = qml.device("default.qubit", wires=1)
+
+        @qml.qnode(dev)
+        def circuit(state_vector):
+            MottonenStatePreparation(state_vector, wires=[0], method="isometry")
+            return qml.expval(qml.PauliZ(0))
+
+        state_vector = np.array([0.6, 0.8], requires_grad=True)
+
+        with pytest.raises(ValueError, match="does not support differentiating"):
+            qml.grad(circuit)(state_vector)
+
+    def test_isometry_default_trainable_state(self, tol):
+        """Tests that the isometry method accepts a PennyLane NumPy array with the default
+        ``requires_grad=True`` if no gradient is computed."""
+        dev = qml.device("default.qubit", wires=1)
+        state_vector = np.array([0.6, 0.8])
+
+        @qml.qnode(dev)
+        def circuit(state_vector):
+            MottonenStatePreparation(state_vector, wires=[0], method="isometry")
+            return qml.expval(qml.PauliZ(0))
+
+        @qml.qnode(dev)
+        def circuit_closure():
+            MottonenStatePreparation(state_vector, wires=[0], method="isometry")
+            return qml.expval(qml.PauliZ(0))
+
+        assert np.allclose(circuit(state_vector), -0.28, atol=tol, rtol=0)
+        assert np.allclose(circuit_closure(), -0.28, atol=tol, rtol=0)
+
+    def test_isometry_jax(self, tol, skip_if_no_jax_support):
+        """Tests that the isometry method treats a JAX array as a constant."""
+        import jax.numpy as jnp
+
+        dev = qml.device("default.qubit.jax", wires=1)
+
+        @qml.qnode(dev, interface="jax")
+        def circuit(state_vector):
+            MottonenStatePreparation(state_vector, wires=[0], method="isometry")
+            return qml.expval(qml.PauliZ(0))
+
+        res = circuit(jnp.array([0.6, 0.8]))
+        assert qml.math.allclose(res, -0.28, atol=tol, rtol=0)
+
+    def test_torch(self, tol, skip_if_no_torch_support):
+        """Tests the torch interface, which converts the cached transformation matrix of
+        the rotation angles without sharing its memory."""
+        import torch
+
+        target_state = [0.5, 0.5, -0.5, -0.5]
+        state_vector = torch.tensor(target_state, dtype=torch.float64, requires_grad=True)
+
+        dev = qml.device("default.qubit", wires=2)
+
+        @qml.qnode(dev, interface="torch")
+        def circuit(state_vector):
+            MottonenStatePreparation(state_vector, wires=[0, 1])
+            return qml.state()
+
+        with warnings.catch_warnings():
+            warnings.filterwarnings("error", message="The given NumPy array is not writable")
+            state = circuit(state_vector)
+
+        overlap = np.vdot(state.detach().numpy(), target_state)
+        assert np.allclose(np.abs(overlap), 1, atol=tol, rtol=0)
+
 
 class TestArbitraryStatePreparation:
     """Test the ArbitraryStatePreparation template."""